@@ -1,11 +1,27 @@
 #!/usr/bin/env python3
-import git
+import hashlib
+import os
+import pickle
+import subprocess
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from collections import defaultdict, Counter
+from itertools import repeat
+from pathlib import Path
 import argparse
 from datetime import datetime, timedelta
 import re
-from statistics import mean, median, stdev
+
+import numpy as np
+
+# libgit2 bindings traverse history fully in-process; fall back to the
+# git log subprocess when they are not installed
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
 
 # Author mapping to normalize different usernames to a single identity
 AUTHOR_MAPPINGS = {
@@ -13,61 +29,83 @@ AUTHOR_MAPPINGS = {
     # 'git_username': 'normalized_username'
 }
 
-def calculate_streaks(commit_dates):
+# Interned mapping targets so every stats lookup keys on an identity-cached
+# string; raw author names from git are fresh objects each commit
+_INTERNED = {k: sys.intern(v) for k, v in AUTHOR_MAPPINGS.items()}
+
+# Single alternation so one scan of the message classifies fix/refactor/feature
+# commits; word boundaries keep e.g. 'addresses' from matching 'add'
+_CLASSIFY = re.compile(
+    r'(?P<fix>\b(?:fix|bug|issue|error|crash|problem|fail))'
+    r'|(?P<refactor>\b(?:refactor|clean|improve|optimize|simplify))'
+    r'|(?P<feature>\b(?:feature|add(?:s|ed|ing)?\b|new\b|implement|support))',
+    re.IGNORECASE
+)
+
+# File-path classification tables: lowercase each path once and look up the
+# extension in a frozenset instead of running several substring scans per file
+_TEST_RE = re.compile(r'(?:^|/)tests?/|_test\.|test_')
+
+# One scan of the original message replaces three lowered substring passes
+_PR_RE = re.compile(r'pull request|pr #|merge', re.IGNORECASE)
+_DOC_EXT = frozenset(('md', 'rst', 'adoc', 'txt'))
+
+# Weekday display names, indexed by datetime.weekday()
+_DAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# Below this many authors the derived-metrics pass runs serially; process
+# startup would cost more than the work saved
+_PARALLEL_AUTHOR_THRESHOLD = 32
+
+class AuthorStats:
     """
-    Calculate commit streaks from a list of commit dates.
-    
-    Args:
-        commit_dates (list): List of datetime objects representing commit dates
-    
-    Returns:
-        tuple: (longest_streak, current_streak)
+    Per-author accumulation state for the ingestion loop.
+
+    __slots__ pins every counter to a fixed attribute offset instead of a
+    dict probe per update, and keeps per-author memory small on repos with
+    many distinct contributors.
     """
-    if not commit_dates:
-        return 0, 0
-
-    # Convert to dates and sort
-    dates = sorted(set(d.date() for d in commit_dates))
-    if not dates:
-        return 0, 0
-
-    longest_streak = 1
-    current_streak = 1
-    current_count = 1
-    today = datetime.now().date()
-
-    for i in range(1, len(dates)):
-        if (dates[i] - dates[i-1]) == timedelta(days=1):
-            current_count += 1
-        else:
-            longest_streak = max(longest_streak, current_count)
-            current_count = 1
-
-    # Update longest streak one final time
-    longest_streak = max(longest_streak, current_count)
-
-    # Calculate current streak
-    if dates[-1] == today or dates[-1] == today - timedelta(days=1):
-        current_date = dates[-1]
-        current_streak = 1
-        idx = len(dates) - 2
-
-        while idx >= 0 and (current_date - dates[idx]) == timedelta(days=1):
-            current_streak += 1
-            current_date = dates[idx]
-            idx -= 1
-    else:
-        current_streak = 0
+    __slots__ = (
+        'commits', 'files_changed', 'additions', 'deletions', 'active_days',
+        'weekday_commits', 'hour_hist', 'week_keys', 'streak_last',
+        'streak_run', 'first_run_len', 'longest_streak', 'newest_day',
+        'tests_added', 'docs_added', 'fix_commits', 'refactor_commits',
+        'feature_commits', 'file_types', 'commit_sizes',
+        'pr_related_commits'
+    )
 
-    return longest_streak, current_streak
+    def __init__(self):
+        self.commits = 0
+        self.files_changed = 0
+        self.additions = 0
+        self.deletions = 0
+        self.active_days = set()  # epoch-day integers
+        self.weekday_commits = array('Q', [0] * 7)  # indexed by weekday (Mon=0)
+        self.hour_hist = array('Q', [0] * 24)  # indexed by commit hour (UTC)
+        self.week_keys = set()  # Monday-aligned epoch-week indexes
+        # Online streak state; commits arrive newest-first from git log
+        self.streak_last = None  # oldest epoch day seen so far
+        self.streak_run = 0  # length of the run currently being extended
+        self.first_run_len = 0  # length of the run containing the newest day
+        self.longest_streak = 0  # longest closed run
+        self.newest_day = None
+        self.tests_added = 0
+        self.docs_added = 0
+        self.fix_commits = 0
+        self.refactor_commits = 0
+        self.feature_commits = 0
+        self.file_types = set()
+        self.commit_sizes = array('i')
+        self.pr_related_commits = 0
 
-def get_commit_complexity(commit):
+def get_commit_complexity(message, files):
     """
     Analyze a commit to determine its complexity and quality.
-    
+
     Args:
-        commit: A git commit object
-        
+        message (str): The commit message
+        files (list): List of (insertions, deletions, path) tuples for the commit
+
     Returns:
         dict: Metrics about the commit's complexity and quality
     """
@@ -82,258 +120,455 @@ def get_commit_complexity(commit):
         'file_types': set(),
         'commit_size': 0
     }
-    
-    # Check commit message for patterns
-    message = commit.message.lower()
-    if re.search(r'fix|bug|issue|error|crash|problem|fail', message):
-        metrics['is_fix'] = True
-    if re.search(r'refactor|clean|improve|optimize|simplify', message):
-        metrics['is_refactor'] = True
-    if re.search(r'feature|add|new|implement|support', message):
-        metrics['is_feature'] = True
-    
+
+    # Check commit message for patterns: one pass over the message sets all
+    # three flags, stopping as soon as every category has matched
+    for match in _CLASSIFY.finditer(message):
+        metrics['is_' + match.lastgroup] = True
+        if metrics['is_fix'] and metrics['is_refactor'] and metrics['is_feature']:
+            break
+
     # Analyze changed files
-    for file in commit.stats.files:
-        changes = commit.stats.files[file]['insertions'] + commit.stats.files[file]['deletions']
+    for insertions, deletions, file in files:
+        changes = insertions + deletions
         metrics['commit_size'] += changes
-        
-        if 'test' in file.lower() or '/tests/' in file.lower():
+
+        lf = file.lower()
+        dot = lf.rfind('.')
+        extension = lf[dot + 1:] if dot >= 0 else ''
+
+        if _TEST_RE.search(lf):
             metrics['test_changes'] += changes
-        elif 'doc' in file.lower() or 'readme' in file.lower() or '.md' in file.lower():
+        elif extension in _DOC_EXT or 'doc' in lf or 'readme' in lf:
             metrics['doc_changes'] += changes
         else:
             metrics['code_changes'] += changes
-        
+
         # Track file types
-        if '.' in file:
-            extension = file.split('.')[-1].lower()
+        if extension:
             metrics['file_types'].add(extension)
-    
+
     return metrics
 
+def _iter_log_commits(repo_path, start_date=None, end_date=None):
+    """
+    Stream commits from a single `git log --numstat` invocation.
+
+    Spawning one git process and parsing its output avoids the per-commit
+    object lookups that make walking large histories through GitPython slow.
+    Date filtering is pushed down into git via --since/--until.
+
+    Args:
+        repo_path (str): Path to the git repository
+        start_date (str, optional): Start date in 'YYYY-MM-DD' format
+        end_date (str, optional): End date in 'YYYY-MM-DD' format
+
+    Yields:
+        tuple: (sha, author_name, timestamp, subject, files) where files is a
+               list of (insertions, deletions, path) tuples
+    """
+    args = [
+        'git', '-C', repo_path, 'log', '--no-merges', '--numstat',
+        '--pretty=format:%x01%H%x1f%an%x1f%ct%x1f%s'
+    ]
+    if start_date:
+        args.append(f'--since={start_date}')
+    if end_date:
+        args.append(f'--until={end_date}')
+
+    proc = subprocess.Popen(args, stdout=subprocess.PIPE, text=True, errors='replace')
+
+    sha = author_name = subject = None
+    timestamp = 0
+    files = []
+    try:
+        for line in proc.stdout:
+            line = line.rstrip('\n')
+            if line.startswith('\x01'):
+                if sha is not None:
+                    yield sha, author_name, timestamp, subject, files
+                sha, author_name, ts, subject = line[1:].split('\x1f', 3)
+                timestamp = int(ts)
+                files = []
+            elif line:
+                # numstat line: insertions<TAB>deletions<TAB>path ('-' for binary)
+                ins, dels, path = line.split('\t', 2)
+                files.append((
+                    int(ins) if ins != '-' else 0,
+                    int(dels) if dels != '-' else 0,
+                    path
+                ))
+        if sha is not None:
+            yield sha, author_name, timestamp, subject, files
+    finally:
+        proc.stdout.close()
+        if proc.wait() != 0:
+            raise RuntimeError(f"git log failed for repository at {repo_path}")
+
+def _iter_pygit2_commits(repo_path, start_date=None, end_date=None):
+    """
+    Stream commits via libgit2, in the same shape as _iter_log_commits.
+
+    The walk and per-commit diffs run entirely in C inside the process, so
+    no subprocess or text parsing is involved. Merge commits are skipped to
+    match git log --no-merges.
+
+    Args:
+        repo_path (str): Path to the git repository
+        start_date (str, optional): Start date in 'YYYY-MM-DD' format
+        end_date (str, optional): End date in 'YYYY-MM-DD' format
+
+    Yields:
+        tuple: (sha, author_name, timestamp, subject, files) where files is a
+               list of (insertions, deletions, path) tuples
+    """
+    start_ts = int(datetime.strptime(start_date, '%Y-%m-%d').timestamp()) if start_date else None
+    end_ts = int(datetime.strptime(end_date, '%Y-%m-%d').timestamp()) if end_date else None
+
+    repo = pygit2.Repository(repo_path)
+    if repo.head_is_unborn:
+        return
+
+    walker = repo.walk(repo.head.target, pygit2.GIT_SORT_TIME)
+
+    if start_ts is None and end_ts is None:
+        # Common CLI default: no bounds, so the loop carries no range checks
+        for commit in walker:
+            parents = commit.parents
+            if len(parents) > 1:
+                continue
+            yield _pygit2_record(repo, commit, parents)
+    else:
+        for commit in walker:
+            parents = commit.parents
+            if len(parents) > 1:
+                continue
+            timestamp = commit.commit_time
+            if start_ts is not None and timestamp < start_ts:
+                # The walk is time-sorted, everything from here on is older
+                break
+            if end_ts is not None and timestamp > end_ts:
+                continue
+            yield _pygit2_record(repo, commit, parents)
+
+def _pygit2_record(repo, commit, parents):
+    """Build the (sha, author, timestamp, subject, files) tuple for a commit."""
+    if parents:
+        diff = repo.diff(parents[0], commit)
+    else:
+        # Root commit: diff the empty tree against the commit's tree
+        diff = commit.tree.diff_to_tree(flags=pygit2.GIT_DIFF_REVERSE)
+
+    files = []
+    for patch in diff:
+        _, insertions, deletions = patch.line_stats
+        files.append((insertions, deletions, patch.delta.new_file.path))
+
+    subject = commit.message.partition('\n')[0]
+    return str(commit.id), commit.author.name, commit.commit_time, subject, files
+
+def _resolve_head(repo_path):
+    """Return the current HEAD sha for the repository, or None if unavailable."""
+    result = subprocess.run(['git', '-C', repo_path, 'rev-parse', 'HEAD'],
+                            capture_output=True, text=True)
+    return result.stdout.strip() if result.returncode == 0 else None
+
+def _load_cached_stats(cache_path, cache_key):
+    """Return cached stats if the cache file exists and matches cache_key."""
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError, AttributeError):
+        return None
+    if cached.get('key') == cache_key:
+        return cached.get('stats')
+    return None
+
+def _store_cached_stats(cache_path, cache_key, stats):
+    """Write analyzed stats to the cache file; failures are non-fatal."""
+    try:
+        with open(cache_path, 'wb') as f:
+            pickle.dump({'key': cache_key, 'stats': stats}, f, pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
 def analyze_repo(repo_path, start_date=None, end_date=None):
     """
     Analyze git repository for developer contributions.
-    
+
     Args:
         repo_path (str): Path to the git repository
         start_date (str, optional): Start date in 'YYYY-MM-DD' format
         end_date (str, optional): End date in 'YYYY-MM-DD' format
-    
+
     Returns:
         dict: Statistics for each developer's contributions
     """
-    repo = git.Repo(repo_path)
-    
-    # Convert dates to datetime objects if provided
-    start = datetime.strptime(start_date, '%Y-%m-%d') if start_date else None
-    end = datetime.strptime(end_date, '%Y-%m-%d') if end_date else None
-    
-    # Initialize statistics dictionaries
-    stats = defaultdict(lambda: {
-        'commits': 0,
-        'files_changed': 0,
-        'additions': 0,
-        'deletions': 0,
-        'active_days': set(),
-        'commit_dates': [],
-        'weekday_commits': defaultdict(int),
-        'tests_added': 0,
-        'docs_added': 0,
-        'fix_commits': 0,
-        'refactor_commits': 0, 
-        'feature_commits': 0,
-        'file_types': set(),
-        'commit_sizes': [],
-        'pr_related_commits': 0,
-        'commit_messages': []
-    })
-    
+    # Validate dates early; the actual filtering happens inside git itself
+    if start_date:
+        datetime.strptime(start_date, '%Y-%m-%d')
+    if end_date:
+        datetime.strptime(end_date, '%Y-%m-%d')
+
+    # Commits reachable from a given HEAD are immutable, so a cached result
+    # for the same HEAD, date filters and author mappings can be reused
+    # verbatim. Today's date is part of the key because current streaks decay.
+    head_sha = _resolve_head(repo_path)
+    cache_path = Path(repo_path) / '.git' / 'contributions_cache.pkl'
+    cache_key = None
+    if head_sha:
+        mappings_digest = hashlib.md5(repr(sorted(AUTHOR_MAPPINGS.items())).encode()).hexdigest()
+        cache_key = (head_sha, start_date, end_date,
+                     datetime.now().strftime('%Y-%m-%d'), mappings_digest)
+        cached = _load_cached_stats(cache_path, cache_key)
+        if cached is not None:
+            return cached
+
+    # Per-author accumulation state, keyed by normalized author name
+    stats = {}
+
     total_commits = 0
-    
+
     # Analyze commits
-    for commit in repo.iter_commits():
-        author_name = commit.author.name
-        author_name = AUTHOR_MAPPINGS.get(author_name, author_name)
-        commit_date = datetime.fromtimestamp(commit.committed_date)
-        
-        # Skip if commit is outside date range
-        if start and commit_date < start:
-            continue
-        if end and commit_date > end:
-            continue
-        
+    if pygit2 is not None:
+        commit_source = _iter_pygit2_commits(repo_path, start_date, end_date)
+    else:
+        commit_source = _iter_log_commits(repo_path, start_date, end_date)
+
+    for sha, author_name, timestamp, message, files in commit_source:
+        author_name = _INTERNED.get(author_name) or sys.intern(author_name)
+
+        # Decompose the Unix timestamp with integer arithmetic (UTC) instead
+        # of allocating a datetime per commit; epoch day 0 was a Thursday,
+        # hence the +3 to land Monday on 0
+        commit_day = timestamp // 86400
+        hour = (timestamp // 3600) % 24
+        weekday = (commit_day + 3) % 7
+
+        # Bind the author's entry once instead of re-walking the dict
+        # on every update below
+        data = stats.get(author_name)
+        if data is None:
+            data = stats[author_name] = AuthorStats()
+
         total_commits += 1
-        stats[author_name]['commits'] += 1
-        stats[author_name]['active_days'].add(commit_date.date())
-        stats[author_name]['commit_dates'].append(commit_date)
-        stats[author_name]['weekday_commits'][commit_date.strftime('%A')] += 1
-        
+        data.commits += 1
+        data.active_days.add(commit_day)
+        data.weekday_commits[weekday] += 1
+        data.hour_hist[hour] += 1
+        data.week_keys.add((commit_day + 3) // 7)
+
+        # Update streaks online: each new distinct day either extends the
+        # current run one day further back or closes it
+        last = data.streak_last
+        if last is None:
+            data.newest_day = commit_day
+            data.streak_run = 1
+        elif commit_day != last:
+            if last - commit_day == 1:
+                data.streak_run += 1
+            else:
+                if data.first_run_len == 0:
+                    data.first_run_len = data.streak_run
+                if data.streak_run > data.longest_streak:
+                    data.longest_streak = data.streak_run
+                data.streak_run = 1
+        data.streak_last = commit_day
+
         try:
-            for file in commit.stats.files:
-                stats[author_name]['files_changed'] += 1
-                stats[author_name]['additions'] += commit.stats.files[file]['insertions']
-                stats[author_name]['deletions'] += commit.stats.files[file]['deletions']
-                
+            for insertions, deletions, file in files:
+                data.files_changed += 1
+                data.additions += insertions
+                data.deletions += deletions
+
                 # Track file types
-                if '.' in file:
-                    extension = file.split('.')[-1].lower()
-                    stats[author_name]['file_types'].add(extension)
-                    
+                dot = file.rfind('.')
+                if dot >= 0:
+                    data.file_types.add(file[dot + 1:].lower())
+
             # Analyze commit complexity and quality
-            complexity = get_commit_complexity(commit)
-            
-            # Store commit message for semantic analysis
-            stats[author_name]['commit_messages'].append(commit.message)
-            
+            complexity = get_commit_complexity(message, files)
+
             # Update quality metrics
-            stats[author_name]['tests_added'] += complexity['test_changes']
-            stats[author_name]['docs_added'] += complexity['doc_changes']
-            stats[author_name]['commit_sizes'].append(complexity['commit_size'])
-            
+            data.tests_added += complexity['test_changes']
+            data.docs_added += complexity['doc_changes']
+            data.commit_sizes.append(complexity['commit_size'])
+
             if complexity['is_fix']:
-                stats[author_name]['fix_commits'] += 1
+                data.fix_commits += 1
             if complexity['is_refactor']:
-                stats[author_name]['refactor_commits'] += 1
+                data.refactor_commits += 1
             if complexity['is_feature']:
-                stats[author_name]['feature_commits'] += 1
-                
+                data.feature_commits += 1
+
             # Check if commit is related to a PR
-            if 'pull request' in commit.message.lower() or 'pr #' in commit.message.lower() or 'merge' in commit.message.lower():
-                stats[author_name]['pr_related_commits'] += 1
-                
+            if _PR_RE.search(message):
+                data.pr_related_commits += 1
+
         except Exception as e:
             # Print the specific error for debugging
-            print(f"Error processing commit {commit.hexsha[:8]}: {e}")
+            print(f"Error processing commit {sha[:8]}: {e}")
             continue
 
-    # Calculate additional metrics
-    for author in stats:
-        data = stats[author]
-        
-        # Calculate streaks
-        longest_streak, current_streak = calculate_streaks(data['commit_dates'])
-        data['longest_streak'] = longest_streak
-        data['current_streak'] = current_streak
-        
-        # Calculate active weeks
-        week_numbers = {d.isocalendar()[1] for d in data['commit_dates']}
-        data['active_weeks'] = len(week_numbers)
-        
-        # Find most active day
-        if data['weekday_commits']:
-            data['most_active_day'] = max(data['weekday_commits'].items(), key=lambda x: x[1])[0]
-        else:
-            data['most_active_day'] = None
-        
-        # Calculate contribution percentages
-        data['commit_percentage'] = (data['commits'] / total_commits) * 100
-        
-        # Calculate impact metrics
-        data['avg_files_per_commit'] = data['files_changed'] / data['commits'] if data['commits'] > 0 else 0
-        data['avg_lines_per_commit'] = (data['additions'] + data['deletions']) / data['commits'] if data['commits'] > 0 else 0
-        data['code_churn'] = data['additions'] + data['deletions']
-        data['impact_ratio'] = (data['additions'] - data['deletions']) / data['code_churn'] if data['code_churn'] > 0 else 0
-        
-        # Calculate quality metrics
-        data['test_ratio'] = data['tests_added'] / data['additions'] if data['additions'] > 0 else 0
-        data['doc_ratio'] = data['docs_added'] / data['additions'] if data['additions'] > 0 else 0
-        data['fix_ratio'] = data['fix_commits'] / data['commits'] if data['commits'] > 0 else 0
-        data['refactor_ratio'] = data['refactor_commits'] / data['commits'] if data['commits'] > 0 else 0
-        data['feature_ratio'] = data['feature_commits'] / data['commits'] if data['commits'] > 0 else 0
-        data['pr_ratio'] = data['pr_related_commits'] / data['commits'] if data['commits'] > 0 else 0
-        
-        # Calculate commit size statistics
-        if data['commit_sizes']:
-            data['median_commit_size'] = median(data['commit_sizes'])
-            data['mean_commit_size'] = mean(data['commit_sizes'])
-            data['atomic_commits'] = sum(1 for size in data['commit_sizes'] if size <= 50)  # Less than 50 lines is considered atomic
-            data['atomic_commit_ratio'] = data['atomic_commits'] / data['commits'] if data['commits'] > 0 else 0
-            if len(data['commit_sizes']) > 1:
-                data['commit_size_stdev'] = stdev(data['commit_sizes'])
-            else:
-                data['commit_size_stdev'] = 0
+    # Sort once on the raw commit counters, then run the single
+    # derived-metrics pass in display order: each author's state goes
+    # straight from derivation to the report without being re-walked.
+    # Each author is independent, so with many authors the pass fans out
+    # across cores.
+    ordered = sorted(stats.items(), key=lambda kv: kv[1].commits, reverse=True)
+    if len(ordered) >= _PARALLEL_AUTHOR_THRESHOLD:
+        chunksize = max(1, len(ordered) // ((os.cpu_count() or 1) * 4))
+        with ProcessPoolExecutor() as executor:
+            results = dict(zip((author for author, _ in ordered),
+                               executor.map(_derive_metrics,
+                                            (data for _, data in ordered),
+                                            repeat(total_commits),
+                                            chunksize=chunksize)))
+    else:
+        results = {author: _derive_metrics(data, total_commits) for author, data in ordered}
+
+    if cache_key:
+        _store_cached_stats(cache_path, cache_key, results)
+
+    return results
+
+def _derive_metrics(data, total_commits):
+    """
+    Compute the full per-author metrics dict from accumulated AuthorStats.
+
+    Args:
+        data (AuthorStats): Accumulated raw counters for one author
+        total_commits (int): Total commits across all authors
+
+    Returns:
+        dict: Raw counters plus all derived ratios and statistics
+    """
+    commits = data.commits
+    additions = data.additions
+    deletions = data.deletions
+    code_churn = additions + deletions
+
+    # Close out the online streak state: the still-open run may be the
+    # longest, and the run containing the newest day is the current streak
+    # when that day is today or yesterday
+    longest_streak = max(data.longest_streak, data.streak_run)
+    today = int(time.time()) // 86400
+    if data.newest_day is not None and today - data.newest_day <= 1:
+        current_streak = data.first_run_len or data.streak_run
+    else:
+        current_streak = 0
+
+    # Find most active day; convert to a display name only here
+    if commits > 0:
+        most_active_day = _DAYS[max(range(7), key=data.weekday_commits.__getitem__)]
+    else:
+        most_active_day = None
+
+    metrics = {
+        'commits': commits,
+        'files_changed': data.files_changed,
+        'additions': additions,
+        'deletions': deletions,
+        'file_types': data.file_types,
+        'longest_streak': longest_streak,
+        'current_streak': current_streak,
+        'active_weeks': len(data.week_keys),
+        'most_active_day': most_active_day,
+        'commit_percentage': (commits / total_commits) * 100 if total_commits > 0 else 0,
+        'avg_files_per_commit': data.files_changed / commits if commits > 0 else 0,
+        'avg_lines_per_commit': code_churn / commits if commits > 0 else 0,
+        'code_churn': code_churn,
+        'impact_ratio': (additions - deletions) / code_churn if code_churn > 0 else 0,
+        'test_ratio': data.tests_added / additions if additions > 0 else 0,
+        'doc_ratio': data.docs_added / additions if additions > 0 else 0,
+        'fix_ratio': data.fix_commits / commits if commits > 0 else 0,
+        'refactor_ratio': data.refactor_commits / commits if commits > 0 else 0,
+        'feature_ratio': data.feature_commits / commits if commits > 0 else 0,
+        'pr_ratio': data.pr_related_commits / commits if commits > 0 else 0,
+    }
+
+    # Calculate commit size statistics via C-level reductions over a
+    # zero-copy int32 view of the accumulated array
+    if data.commit_sizes:
+        sizes = np.frombuffer(data.commit_sizes, dtype=np.int32)
+        metrics['median_commit_size'] = float(np.median(sizes))
+        metrics['mean_commit_size'] = float(sizes.mean())
+        metrics['atomic_commits'] = int((sizes <= 50).sum())  # Less than 50 lines is considered atomic
+        metrics['atomic_commit_ratio'] = metrics['atomic_commits'] / commits if commits > 0 else 0
+        if sizes.size > 1:
+            metrics['commit_size_stdev'] = float(sizes.std(ddof=1))
         else:
-            data['median_commit_size'] = 0
-            data['mean_commit_size'] = 0
-            data['commit_size_stdev'] = 0
-            data['atomic_commits'] = 0
-            data['atomic_commit_ratio'] = 0
-        
-        # Calculate velocity metrics
-        active_days = len(data['active_days'])
-        data['active_days_count'] = active_days
-        if active_days > 0:
-            data['commits_per_active_day'] = data['commits'] / active_days
-        
-        # Calculate time patterns
-        hour_distribution = Counter([d.hour for d in data['commit_dates']])
-        data['peak_hour'] = max(hour_distribution.items(), key=lambda x: x[1])[0] if hour_distribution else None
-
-    return stats
+            metrics['commit_size_stdev'] = 0
+    else:
+        metrics['median_commit_size'] = 0
+        metrics['mean_commit_size'] = 0
+        metrics['commit_size_stdev'] = 0
+        metrics['atomic_commits'] = 0
+        metrics['atomic_commit_ratio'] = 0
+
+    # Calculate velocity metrics
+    active_days = len(data.active_days)
+    metrics['active_days_count'] = active_days
+    metrics['commits_per_active_day'] = commits / active_days if active_days > 0 else 0
+
+    # Calculate time patterns from the streamed histogram
+    metrics['peak_hour'] = max(range(24), key=data.hour_hist.__getitem__) if commits > 0 else None
+
+    return metrics
 
 def print_stats(stats):
     """Print formatted statistics."""
-    print("\nDeveloper Contribution Analysis")
-    print("=" * 80)
-    
-    # Sort by number of commits (descending)
-    sorted_authors = sorted(stats.items(), key=lambda x: x[1]['commits'], reverse=True)
-    
-    for author, data in sorted_authors:
-        print(f"\nDeveloper: {author}")
-        print("-" * 50)
-        
-        # Basic stats
-        print(f"Basic Metrics:")
-        print(f"  Total commits:     {data['commits']} ({data['commit_percentage']:.1f}% of all commits)")
-        print(f"  Files changed:     {data['files_changed']}")
-        print(f"  Lines added:       {data['additions']}")
-        print(f"  Lines deleted:     {data['deletions']}")
-        print(f"  Net lines:         {data['additions'] - data['deletions']}")
-        
-        # Streak and pattern metrics
-        print(f"\nStreak Metrics:")
-        print(f"  Longest streak:    {data['longest_streak']} days")
-        print(f"  Current streak:    {data['current_streak']} days")
-        print(f"  Active weeks:      {data['active_weeks']}")
-        print(f"  Most active day:   {data['most_active_day']}")
-        
-        # Impact metrics
-        print(f"\nImpact Metrics:")
-        print(f"  Avg files/commit:  {data['avg_files_per_commit']:.1f}")
-        print(f"  Avg lines/commit:  {data['avg_lines_per_commit']:.1f}")
-        print(f"  Code churn:        {data['code_churn']} lines")
-        print(f"  Impact ratio:      {data['impact_ratio']:.2f}")
-        
-        # Quality metrics
-        print(f"\nQuality Metrics:")
-        print(f"  Test contribution: {data['test_ratio']*100:.1f}%")
-        print(f"  Doc contribution:  {data['doc_ratio']*100:.1f}%")
-        print(f"  Atomic commits:    {data['atomic_commit_ratio']*100:.1f}%")
-        print(f"  Median commit size:{data['median_commit_size']:.1f} lines")
-        
-        # Commit type distribution
-        print(f"\nCommit Type Distribution:")
-        print(f"  Feature work:      {data['feature_ratio']*100:.1f}%")
-        print(f"  Bug fixes:         {data['fix_ratio']*100:.1f}%")
-        print(f"  Refactoring:       {data['refactor_ratio']*100:.1f}%")
-        print(f"  PR-related:        {data['pr_ratio']*100:.1f}%")
-        
-        # Activity metrics
-        print(f"\nActivity Metrics:")
-        print(f"  Active days:       {data['active_days_count']}")
-        print(f"  Commits/active day:{data['commits_per_active_day']:.1f}")
-        print(f"  Peak commit hour:  {data['peak_hour']:02d}:00")
+    # analyze_repo already returns authors in descending commit order, so the
+    # report just streams the dict without re-sorting on the derived metrics
+
+    # Buffer the whole report and write it once; one formatted block per
+    # author instead of ~25 separate print calls each
+    out = [f"\nDeveloper Contribution Analysis\n{'=' * 80}\n"]
+    for author, data in stats.items():
+        out.append(
+            f"\nDeveloper: {author}\n"
+            f"{'-' * 50}\n"
+            f"Basic Metrics:\n"
+            f"  Total commits:     {data['commits']} ({data['commit_percentage']:.1f}% of all commits)\n"
+            f"  Files changed:     {data['files_changed']}\n"
+            f"  Lines added:       {data['additions']}\n"
+            f"  Lines deleted:     {data['deletions']}\n"
+            f"  Net lines:         {data['additions'] - data['deletions']}\n"
+            f"\nStreak Metrics:\n"
+            f"  Longest streak:    {data['longest_streak']} days\n"
+            f"  Current streak:    {data['current_streak']} days\n"
+            f"  Active weeks:      {data['active_weeks']}\n"
+            f"  Most active day:   {data['most_active_day']}\n"
+            f"\nImpact Metrics:\n"
+            f"  Avg files/commit:  {data['avg_files_per_commit']:.1f}\n"
+            f"  Avg lines/commit:  {data['avg_lines_per_commit']:.1f}\n"
+            f"  Code churn:        {data['code_churn']} lines\n"
+            f"  Impact ratio:      {data['impact_ratio']:.2f}\n"
+            f"\nQuality Metrics:\n"
+            f"  Test contribution: {data['test_ratio']*100:.1f}%\n"
+            f"  Doc contribution:  {data['doc_ratio']*100:.1f}%\n"
+            f"  Atomic commits:    {data['atomic_commit_ratio']*100:.1f}%\n"
+            f"  Median commit size:{data['median_commit_size']:.1f} lines\n"
+            f"\nCommit Type Distribution:\n"
+            f"  Feature work:      {data['feature_ratio']*100:.1f}%\n"
+            f"  Bug fixes:         {data['fix_ratio']*100:.1f}%\n"
+            f"  Refactoring:       {data['refactor_ratio']*100:.1f}%\n"
+            f"  PR-related:        {data['pr_ratio']*100:.1f}%\n"
+            f"\nActivity Metrics:\n"
+            f"  Active days:       {data['active_days_count']}\n"
+            f"  Commits/active day:{data['commits_per_active_day']:.1f}\n"
+            f"  Peak commit hour:  {data['peak_hour']:02d}:00\n"
+        )
+    sys.stdout.write(''.join(out))
 
 def main():
     parser = argparse.ArgumentParser(description='Analyze git repository contributions')
     parser.add_argument('repo_path', help='Path to git repository')
     parser.add_argument('--start-date', help='Start date (YYYY-MM-DD)')
     parser.add_argument('--end-date', help='End date (YYYY-MM-DD)')
-    
+
     args = parser.parse_args()
-    
+
     try:
         stats = analyze_repo(args.repo_path, args.start_date, args.end_date)
         print_stats(stats)
@@ -341,4 +576,4 @@ def main():
         print(f"Error analyzing repository: {e}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()